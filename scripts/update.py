@@ -0,0 +1,527 @@
+#!/usr/bin/env python3
+"""
+Apply the multi-instance migration passes to schema and tool files.
+
+Usage: update.py PASS [PASS ...]
+
+Passes:
+  schemas      add ...instanceParameterSchema to every z.object() in src/schemas
+  all-schemas  add ...instanceParameterSchema to exported schemas in board/card/bulk schemas
+  tools        add instance support to tool handlers
+  board-tools  add instance support to board tool handlers
+
+Passes run in the order given. Each file is read once, every selected pass
+that targets it is applied in memory, and it is written back at most once.
+"""
+
+import argparse
+import io
+import mmap
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+# Plain string paths: files come straight from os.scandir entries, so no
+# Path objects are built per file
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCHEMAS_DIR = os.path.join(REPO_ROOT, "src", "schemas")
+TOOLS_DIR = os.path.join(REPO_ROOT, "src", "server", "tools")
+SKIPPED_FILES = ('common-schemas.ts', 'index.ts')
+
+# schemas pass
+COMMON_IMPORT_PATTERN = re.compile(r"import\s*\{([^}]+)\}\s*from\s*['\"]\.\/common-schemas\.js['\"];")
+FIRST_IMPORT_PATTERN = re.compile(r"(import\s+\{[^}]+\}\s+from\s+['\"][^'\"]+['\"];)")
+
+# all-schemas pass
+ZOD_IMPORT_PATTERN = re.compile(r"(import { z } from 'zod';)")
+# Start of: export const somethingSchema = z.object({ ... });
+SCHEMA_START_PATTERN = re.compile(r'export const (\w+Schema) = z\.object\(\{')
+# Braces plus the TypeScript strings and comments whose braces must not count
+BRACE_TOKEN_PATTERN = re.compile(
+    r"""[{}]|'(?:\\.|[^'\\\n])*'|"(?:\\.|[^"\\\n])*"|`(?:\\.|[^`\\])*`|//[^\n]*|/\*.*?\*/""",
+    re.DOTALL,
+)
+
+# tools pass
+# Match: async ({ params }) => { try { code
+HANDLER_PATTERN = re.compile(r'async \((\{[^}]*\})\) => \{\s*try \{\s*(.*?)(?=\n\s*\})', re.DOTALL)
+PARAMS_HANDLER_START = 'async (params) => {'
+TRY_START_PATTERN = re.compile(r'\s*try \{')
+
+# board-tools pass
+_PAT_PARAMS = re.compile(r'async \(params\) => \{\s*try \{\s*const ')
+_PAT_EXISTING_CLIENT = re.compile(r'\s*const client = await getClientForInstance')
+CLIENT_LINE = '          const client = await getClientForInstance(clientOrFactory, instance);\n'
+
+# Destructured params without instance, e.g. async ({ board_id, board_name, workspace_id }) => {
+BOARD_HANDLER_PARAMS = (
+    'board_id, board_name, workspace_id',
+    'board_id',
+    'name, description, workspace_id',
+    'board_id, name, description',
+    'card_id, archive_first = true',
+    'resource_ids, analyze_dependencies = true',
+    'workflow_id, name, position, color, description',
+    'lane_id',
+)
+BOARD_HANDLER_REPLACEMENTS = {
+    params: f'async ({{ {params}, instance }}: any) => {{' for params in BOARD_HANDLER_PARAMS
+}
+# One alternation so the file is scanned once for all handler shapes
+_PAT_BOARD_HANDLERS = re.compile(
+    r'async \(\{ (?P<params>' + '|'.join(map(re.escape, BOARD_HANDLER_PARAMS)) + r') \}\) => \{'
+)
+
+
+# --- schemas pass ---
+
+def has_instance_import(content: str) -> bool:
+    """Check if file already imports instanceParameterSchema"""
+    return "instanceParameterSchema" in content
+
+def has_common_import(content: str) -> bool:
+    """Check if file already imports from common-schemas"""
+    return "from './common-schemas.js'" in content or 'from "./common-schemas.js"' in content
+
+def add_instance_import(content: str, common_import: bool) -> str:
+    """Add instanceParameterSchema import to common-schemas import"""
+    # Check if already has import from common-schemas
+    if common_import:
+        # Add instanceParameterSchema to existing import
+        match = COMMON_IMPORT_PATTERN.search(content)
+        if match:
+            imports = match.group(1).strip()
+            if "instanceParameterSchema" not in imports:
+                new_imports = f"{imports}, instanceParameterSchema"
+                content = (
+                    f"{content[:match.start()]}import {{ {new_imports} }} from './common-schemas.js';"
+                    f"{content[match.end():]}"
+                )
+    else:
+        # Add new import after first import statement
+        match = FIRST_IMPORT_PATTERN.search(content)
+        if match:
+            content = (
+                f"{content[:match.end()]}\nimport {{ instanceParameterSchema }} from './common-schemas.js';"
+                f"{content[match.end():]}"
+            )
+    return content
+
+def add_instance_to_schema(content: str) -> str:
+    """Add ...instanceParameterSchema to all z.object() declarations"""
+    # Pattern to match z.object({ ... })
+    # We need to find the closing }) and add the spread before it
+
+    # Single pass over the lines; whether the current schema already has the
+    # spread is tracked as we go instead of re-joining its lines at the end
+    out = io.StringIO()
+    in_schema = False
+    brace_count = 0
+    schema_has_spread = False
+
+    for i, line in enumerate(content.split('\n')):
+        # Check if this line starts a schema definition
+        if 'z.object({' in line:
+            in_schema = True
+            brace_count = line.count('{') - line.count('}')
+            schema_has_spread = '...instanceParameterSchema' in line
+        elif in_schema:
+            # Most property lines have no braces; skip counting for those
+            if '{' in line or '}' in line:
+                brace_count += line.count('{') - line.count('}')
+            schema_has_spread |= '...instanceParameterSchema' in line
+
+            # If we're closing the schema object
+            if brace_count == 0 and '});' in line:
+                if not schema_has_spread:
+                    # Add the spread parameter before closing
+                    if line.strip() == '});':
+                        out.write('\n  ...instanceParameterSchema,')
+                    else:
+                        # Insert before the });
+                        line = line.replace('});', '  ...instanceParameterSchema,\n});')
+
+                in_schema = False
+                brace_count = 0
+                schema_has_spread = False
+
+        if i:
+            out.write('\n')
+        out.write(line)
+
+    return out.getvalue()
+
+def update_schemas(content: str) -> str:
+    """schemas pass: add the import and spread unless the file already has them"""
+    # Check if already updated; the spread can only be present when the
+    # bare token is, so the cheaper check runs first
+    has_import = has_instance_import(content)
+    if has_import and '...instanceParameterSchema' in content:
+        return content
+
+    # Add import if needed
+    if not has_import:
+        content = add_instance_import(content, has_common_import(content))
+
+    # Add instance parameter to all schemas
+    return add_instance_to_schema(content)
+
+
+# --- all-schemas pass ---
+
+def find_closing_brace(content: str, start: int) -> int:
+    """Return the index of the '}' closing the object opened just before start, or -1"""
+    depth = 1
+    for token in BRACE_TOKEN_PATTERN.finditer(content, start):
+        brace = token.group()
+        if brace == '{':
+            depth += 1
+        elif brace == '}':
+            depth -= 1
+            if depth == 0:
+                return token.start()
+    return -1
+
+def add_instance_param(schema_name: str, schema_body: str) -> str:
+    """Rebuild one exported schema with ...instanceParameterSchema appended"""
+    full = f"export const {schema_name} = z.object({{{schema_body}}});"
+
+    # Skip if already has instanceParameterSchema
+    if '...instanceParameterSchema' in schema_body or 'instanceParameterSchema' in schema_name:
+        return full
+
+    # Skip utility schemas that are truly empty (no parameters at all)
+    if schema_body.strip() == '':
+        # These empty schemas should get instance param
+        return f"export const {schema_name} = z.object({{\n  ...instanceParameterSchema,\n}});"
+
+    # Has content, add instance param after existing props
+    return f"export const {schema_name} = z.object({{{with_trailing_comma(schema_body)}  ...instanceParameterSchema,\n}});"
+
+def code_end(text: str) -> int:
+    """Return the index just past the last code character of text, ignoring comments"""
+    end = 0
+    pos = 0
+    # Tokens are braces, string literals and comments; everything between
+    # them is plain code or whitespace
+    for token in BRACE_TOKEN_PATTERN.finditer(text):
+        gap = text[pos:token.start()].rstrip()
+        if gap.strip():
+            end = pos + len(gap)
+        if not token.group().startswith(('//', '/*')):
+            end = token.end()
+        pos = token.end()
+    gap = text[pos:].rstrip()
+    if gap.strip():
+        end = pos + len(gap)
+    return end
+
+def with_trailing_comma(schema_body: str) -> str:
+    """Ensure the last property ends with a comma and the body ends with a newline"""
+    # The comma goes after the last code token, before any trailing comment
+    end = code_end(schema_body)
+    if end and schema_body[end - 1] not in ',{':
+        schema_body = f"{schema_body[:end]},{schema_body[end:]}"
+    # Drop the indentation of a closing brace so the spread starts its own line
+    schema_body = schema_body.rstrip(' \t')
+    return schema_body if schema_body.endswith('\n') else schema_body + '\n'
+
+def update_all_schemas(content: str) -> str:
+    """all-schemas pass: add the zod-adjacent import and spread every exported schema"""
+    # Check if we already have the import
+    if 'import { instanceParameterSchema } from' not in content:
+        # Add import after first import statement
+        content = ZOD_IMPORT_PATTERN.sub(
+            r"\1\nimport { instanceParameterSchema } from './common-schemas.js';",
+            content
+        )
+
+    # Walk braces from each schema start to its matching '}' so nested objects
+    # are handled in one linear pass instead of regex backtracking
+    parts = []
+    pos = 0
+    for match in SCHEMA_START_PATTERN.finditer(content):
+        if match.start() < pos:
+            continue
+        close = find_closing_brace(content, match.end())
+        if close == -1 or not content.startswith(');', close + 1):
+            continue
+        parts.append(content[pos:match.start()])
+        parts.append(add_instance_param(match.group(1), content[match.end():close]))
+        pos = close + 3
+    parts.append(content[pos:])
+    return ''.join(parts)
+
+
+# --- tools pass ---
+
+def fix_handler(match: re.Match) -> str:
+    """Add instance to a destructured handler and resolve its client"""
+    full = match.group(0)
+    params = match.group(1)
+    body = match.group(2)
+
+    # Skip if already has instance
+    if 'instance' in params or 'getClientForInstance' in body:
+        return full
+
+    # Add instance to params
+    if params.strip() == '':
+        new_params = '{ instance }: any'
+    else:
+        new_params = params.rstrip('}') + ', instance }: any'
+
+    # Add getClientForInstance call
+    indent = '          '
+    client_call = f'{indent}const client = await getClientForInstance(clientOrFactory, instance);\n{indent}'
+
+    return f'async ({new_params}) => {{\n        try {{\n{client_call}{body}'
+
+def use_rest_params(text: str) -> str:
+    """Rewrite client.method(params) calls to client.method(restParams) without the regex engine"""
+    parts = []
+    pos = 0
+    start = text.find('client.')
+    while start != -1:
+        # Walk the method name (\w+) and check it is called with exactly (params)
+        end = start + len('client.')
+        name_start = end
+        while end < len(text) and (text[end].isalnum() or text[end] == '_'):
+            end += 1
+        if end > name_start and text.startswith('(params)', end):
+            parts.append(text[pos:end])
+            parts.append('(restParams)')
+            pos = end + len('(params)')
+            start = text.find('client.', pos)
+        else:
+            # Another 'client.' may start inside the name just walked (client.client.x)
+            start = text.find('client.', name_start)
+    parts.append(text[pos:])
+    return ''.join(parts)
+
+def fix_params_handler(full: str) -> str:
+    """Split instance out of a params handler and resolve its client"""
+    # Skip if already has instance
+    if 'instance' in full or 'getClientForInstance' in full:
+        return full
+
+    # Replace: async (params) => { try {
+    # With: async (params: any) => { try { const { instance, ...restParams } = params; const client = await getClientForInstance(clientOrFactory, instance);
+    fixed = full.replace(
+        'async (params) => {\n        try {\n          ',
+        'async (params: any) => {\n        try {\n          const { instance, ...restParams } = params;\n          const client = await getClientForInstance(clientOrFactory, instance);\n          '
+    )
+
+    # Also replace 'client.method(params)' with 'client.method(restParams)'
+    if '(params)' in fixed:
+        fixed = use_rest_params(fixed)
+
+    return fixed
+
+def update_tools(content: str) -> str:
+    """tools pass: add instance parameter support to tool handlers"""
+    # Pattern 1: async ({ param1, param2 }) => { try { ... await client.method()
+    # fix_handler leaves already-migrated handlers untouched. The DOTALL scan
+    # only runs when a destructured handler can exist at all; a whole-file
+    # "already migrated" sentinel is not used because it would also skip
+    # partly migrated files
+    if 'async ({' in content:
+        content = HANDLER_PATTERN.sub(fix_handler, content)
+
+    # Pattern 2: async (params) => { try { const var = params; ... await client.method(params)
+    # Each handler is located literally and its body delimited by walking
+    # braces, so the scan stays linear with no regex backtracking
+    parts = []
+    pos = 0
+    start = content.find(PARAMS_HANDLER_START)
+    while start != -1:
+        body = start + len(PARAMS_HANDLER_START)
+        # Only walk bodies that open with try {; an unbalanced body skips
+        # just this handler
+        close = find_closing_brace(content, body) if TRY_START_PATTERN.match(content, body) else -1
+        if close == -1:
+            start = content.find(PARAMS_HANDLER_START, body)
+            continue
+        parts.append(content[pos:start])
+        parts.append(fix_params_handler(content[start:close]))
+        pos = close
+        start = content.find(PARAMS_HANDLER_START, close)
+    parts.append(content[pos:])
+    return ''.join(parts)
+
+
+# --- board-tools pass ---
+
+def add_get_client(content: str, insert_points: list[int]) -> str:
+    """Add getClientForInstance after the try { following each insert point, if not present"""
+    parts = []
+    pos = 0
+    for point in insert_points:
+        try_pos = content.find('try {', point)
+        # Only the handler's own try block, opened on a line of its own
+        if try_pos == -1 or '}' in content[point:try_pos] or not content.startswith('try {\n', try_pos):
+            continue
+        body_pos = try_pos + len('try {\n')
+        if _PAT_EXISTING_CLIENT.match(content, body_pos):
+            continue
+        parts.append(content[pos:body_pos])
+        parts.append(CLIENT_LINE)
+        pos = body_pos
+    parts.append(content[pos:])
+    return ''.join(parts)
+
+def update_board_tools(content: str) -> str:
+    """board-tools pass: add instance parameter support to board tool handlers"""
+    # async (params) => { try { const ... gets instance split out of params
+    content = _PAT_PARAMS.sub(
+        r'async (params: any) => {\n        try {\n          const { instance, ...restParams } = params;\n          const client = await getClientForInstance(clientOrFactory, instance);\n          const ',
+        content
+    )
+
+    # Replace 'await client.getBoards(params)' with 'await client.getBoards(restParams)'
+    content = content.replace('await client.getBoards(params)', 'await client.getBoards(restParams)')
+
+    # Rewrite destructured handlers, recording where each rewritten one ends
+    # in the new content so only those handlers are revisited below
+    parts = []
+    insert_points = []
+    pos = 0
+    new_len = 0
+    for match in _PAT_BOARD_HANDLERS.finditer(content):
+        replacement = BOARD_HANDLER_REPLACEMENTS[match.group('params')]
+        parts.append(content[pos:match.start()])
+        parts.append(replacement)
+        new_len += match.start() - pos + len(replacement)
+        insert_points.append(new_len)
+        pos = match.end()
+    parts.append(content[pos:])
+    content = ''.join(parts)
+
+    # Add getClientForInstance after try { in the rewritten handlers
+    return add_get_client(content, insert_points)
+
+
+# --- driver ---
+
+def schema_dir_files() -> list[str]:
+    """All schema files except common-schemas.ts and index.ts"""
+    if not os.path.isdir(SCHEMAS_DIR):
+        print(f"Error: Schemas directory not found: {SCHEMAS_DIR}")
+        sys.exit(1)
+
+    files = []
+    with os.scandir(SCHEMAS_DIR) as it:
+        for entry in it:
+            if entry.is_file() and entry.name.endswith('.ts') and entry.name not in SKIPPED_FILES:
+                files.append(entry.path)
+    return files
+
+PASSES = {
+    'schemas': (update_schemas, schema_dir_files),
+    'all-schemas': (update_all_schemas, lambda: [
+        os.path.join(SCHEMAS_DIR, 'board-schemas.ts'),
+        os.path.join(SCHEMAS_DIR, 'card-schemas.ts'),
+        os.path.join(SCHEMAS_DIR, 'bulk-schemas.ts'),
+    ]),
+    'tools': (update_tools, lambda: [
+        os.path.join(TOOLS_DIR, 'board-tools.ts'),
+        os.path.join(TOOLS_DIR, 'card-tools.ts'),
+    ]),
+    'board-tools': (update_board_tools, lambda: [os.path.join(TOOLS_DIR, 'board-tools.ts')]),
+}
+
+def read_mapped(f) -> str:
+    """Decode an open binary file straight from a read-only mapping"""
+    if not os.fstat(f.fileno()).st_size:
+        # Empty files cannot be mapped
+        return ''
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+        content = str(view, 'utf-8')
+    # Same newline translation text mode would apply
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+def write_contents(f, content: str) -> None:
+    """Replace the contents of an open binary file using raw positioned writes"""
+    data = memoryview(content.encode('utf-8'))
+    fd = f.fileno()
+    # One write for the whole buffer in practice; loop only on short writes
+    written = 0
+    while written < len(data):
+        written += os.pwrite(fd, data[written:], written)
+    os.ftruncate(fd, len(data))
+
+def update_file(filepath: str, transforms: list) -> tuple[str, bool, Optional[str], str]:
+    """Apply transforms to one file with a single read and at most one write.
+
+    Returns (path, whether it was written, error or None, status message) so
+    output can be printed from the main thread.
+    """
+    try:
+        with open(filepath, 'rb+') as f:
+            content = read_mapped(f)
+            original_content = content
+
+            for transform in transforms:
+                content = transform(content)
+
+            if content == original_content:
+                return filepath, False, None, "No changes needed"
+
+            write_contents(f, content)
+    except FileNotFoundError:
+        return filepath, False, None, "File not found"
+    except Exception as e:
+        return filepath, False, str(e), "Failed"
+
+    return filepath, True, None, "Updated successfully"
+
+def main(argv=None):
+    """Run the selected passes over their target files"""
+    parser = argparse.ArgumentParser(description="Apply multi-instance migration passes")
+    parser.add_argument('passes', nargs='+', choices=list(PASSES), metavar='PASS',
+                        help=f"one or more of: {', '.join(PASSES)}")
+    args = parser.parse_args(argv)
+
+    # Group transforms by file, keeping pass order, so files shared between
+    # passes are read and written once
+    file_transforms = {}
+    for name in dict.fromkeys(args.passes):
+        transform, files = PASSES[name]
+        for filepath in files():
+            file_transforms.setdefault(filepath, []).append(transform)
+
+    if not file_transforms:
+        print("No files to update")
+        sys.exit(1)
+
+    # Files are independent, so overlap their read/write syscalls
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        results = list(executor.map(update_file, file_transforms, file_transforms.values()))
+
+    # Collect the report and emit it with one write
+    msgs = []
+    errors = []
+    updated_count = 0
+    for filepath, updated, error, status in results:
+        name = os.path.relpath(filepath, REPO_ROOT)
+        msgs.append(f"Processing {name}...\n")
+        msgs.append(f"  {status}\n")
+        if error is not None:
+            errors.append(f"Error updating {name}: {error}\n")
+        if updated:
+            updated_count += 1
+
+    msgs.append(f"\nCompleted: {updated_count} files updated\n")
+    sys.stdout.writelines(msgs)
+    sys.stdout.flush()
+
+    if errors:
+        sys.stderr.writelines(errors)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()